@@ -1,9 +1,42 @@
 """PII detection and redaction for GenXAI."""
 
+import atexit
+import glob
+import hashlib
+import math
+import os
 import re
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, BinaryIO
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+def _encode_entry(entry: Dict[str, Any]) -> bytes:
+    """Serialize an audit log entry as a JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+
+def _decode_entry(line: bytes) -> Dict[str, Any]:
+    """Parse an audit log JSON line."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
 
 
 # PII patterns
@@ -19,6 +52,79 @@ PII_PATTERNS = {
 }
 
 
+# Directory for compiled pattern artifacts reused across processes
+PII_CACHE_DIR = os.getenv("GENXAI_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "genxai"))
+
+# Minimum Shannon entropy (bits per character) for an api_key candidate
+API_KEY_MIN_ENTROPY = 3.5
+
+# c * log2(c) for small character counts, used by _shannon_entropy
+_C_LOG2_C = [c * math.log2(c) if c else 0.0 for c in range(65)]
+
+
+def _shannon_entropy(value: str) -> float:
+    """Compute the Shannon entropy of a string in bits per character."""
+    n = len(value)
+    if not n:
+        return 0.0
+    
+    total = 0.0
+    for c in Counter(value).values():
+        total += _C_LOG2_C[c] if c < 65 else c * math.log2(c)
+    
+    return math.log2(n) - total / n
+
+
+def _is_high_entropy(value: str) -> bool:
+    """Check whether an api_key candidate looks like a random secret."""
+    return _shannon_entropy(value) > API_KEY_MIN_ENTROPY
+
+
+# Post-match filters that reject low-signal candidates per PII type
+MATCH_FILTERS = {
+    "api_key": _is_high_entropy,
+}
+
+_LAST4_PREFIX = "***-***-"
+
+
+def _mask_email(value: str) -> str:
+    """Mask an email address: email@example.com -> e***@example.com."""
+    local, _, domain = value.rpartition("@")
+    return f"{local[:1]}***@{domain}" if local else "***"
+
+
+def _mask_last4(value: str) -> str:
+    """Mask a number, showing the last 4 digits."""
+    return _LAST4_PREFIX + value[-4:]
+
+
+def _mask_ip(value: str) -> str:
+    """Mask an IP address, showing the first octet."""
+    return value.partition(".")[0] + ".***.***.***"
+
+
+def _mask_default(value: str) -> str:
+    """Mask a value, showing the last 4 characters."""
+    return "***" + value[-4:] if len(value) > 4 else "***"
+
+
+# Masking function per PII type used by PIIRedactor.mask
+MASKERS = {
+    "email": _mask_email,
+    "phone": _mask_last4,
+    "ssn": _mask_last4,
+    "credit_card": _mask_last4,
+    "ip_address": _mask_ip,
+}
+
+# Value types dispatched on by PIIRedactor.redact_dict
+_WALK_TYPES = (str, dict, list)
+
+# Separator used to scan many string leaves in one pass
+_LEAF_SEPARATOR = "\x00"
+
+
 @dataclass
 class PIIMatch:
     """PII match result."""
@@ -29,7 +135,14 @@ class PIIMatch:
 
 
 class PIIDetector:
-    """Detect PII in text."""
+    """Detect PII in text.
+    
+    When python-hyperscan is installed, all patterns are compiled into one
+    Hyperscan database that scans ASCII text once to find which PII types
+    occur; only those patterns are then run through ``re`` to extract match
+    positions with the usual semantics. Non-ASCII text skips the prefilter
+    because Hyperscan's ``\\b``/``\\d`` are ASCII-only.
+    """
     
     def __init__(self, patterns: Optional[Dict[str, str]] = None):
         """Initialize PII detector.
@@ -38,6 +151,77 @@ class PIIDetector:
             patterns: Custom PII patterns (default: use built-in patterns)
         """
         self.patterns = patterns or PII_PATTERNS
+        self._pii_types = list(self.patterns)
+        self._hs_db = self._compile_hyperscan() if HYPERSCAN_AVAILABLE else None
+    
+    def _hyperscan_cache_path(self) -> str:
+        """Get the on-disk cache path for this detector's Hyperscan database."""
+        digest = hashlib.sha256()
+        digest.update(getattr(hyperscan, "__version__", "").encode("utf-8"))
+        for pii_type, pattern in self.patterns.items():
+            digest.update(f"\0{pii_type}\0{pattern}".encode("utf-8"))
+        return os.path.join(PII_CACHE_DIR, f"pii_patterns-{digest.hexdigest()[:16]}.hsdb")
+    
+    def _compile_hyperscan(self):
+        """Compile all patterns into a Hyperscan database.
+        
+        The serialized database is cached under ``PII_CACHE_DIR`` keyed by a
+        hash of the patterns, so later processes skip compilation.
+        
+        Returns:
+            Hyperscan database, or None if a pattern is not supported
+        """
+        cache_path = self._hyperscan_cache_path()
+        try:
+            with open(cache_path, "rb") as f:
+                db = hyperscan.loadb(f.read(), hyperscan.HS_MODE_BLOCK)
+            db.scratch = hyperscan.Scratch(db)
+            return db
+        except Exception:
+            pass
+        
+        flags = hyperscan.HS_FLAG_SINGLEMATCH
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[p.encode("ascii") for p in self.patterns.values()],
+                ids=list(range(len(self._pii_types))),
+                elements=len(self._pii_types),
+                flags=[flags] * len(self._pii_types),
+            )
+        except Exception:
+            return None
+        
+        try:
+            os.makedirs(PII_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(hyperscan.dumpb(db))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        
+        return db
+    
+    def _candidate_types(self, text: str) -> List[str]:
+        """Get PII types whose patterns may match the text.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            PII types to run through ``re`` (all types without Hyperscan)
+        """
+        if self._hs_db is None or not text.isascii():
+            return self._pii_types
+        
+        found = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            found.add(pattern_id)
+        
+        self._hs_db.scan(text.encode("ascii"), match_event_handler=on_match)
+        return [t for i, t in enumerate(self._pii_types) if i in found]
     
     def detect(self, text: str) -> List[PIIMatch]:
         """Detect all PII in text.
@@ -50,8 +234,9 @@ class PIIDetector:
         """
         matches = []
         
-        for pii_type, pattern in self.patterns.items():
-            for match in re.finditer(pattern, text):
+        for pii_type in self._candidate_types(text):
+            pattern = self.patterns[pii_type]
+            for match in self._finditer(pii_type, pattern, text):
                 matches.append(PIIMatch(
                     pii_type=pii_type,
                     value=match.group(),
@@ -64,6 +249,22 @@ class PIIDetector:
         
         return matches
     
+    def _finditer(self, pii_type: str, pattern: str, text: str):
+        """Iterate over matches of one pattern, applying its match filter.
+        
+        Args:
+            pii_type: PII type of the pattern
+            pattern: Regex pattern
+            text: Text to scan
+            
+        Yields:
+            Regex matches accepted by the filter for pii_type
+        """
+        accept = MATCH_FILTERS.get(pii_type)
+        for match in re.finditer(pattern, text):
+            if accept is None or accept(match.group()):
+                yield match
+    
     def detect_type(self, text: str, pii_type: str) -> List[PIIMatch]:
         """Detect specific PII type.
         
@@ -80,7 +281,7 @@ class PIIDetector:
         pattern = self.patterns[pii_type]
         matches = []
         
-        for match in re.finditer(pattern, text):
+        for match in self._finditer(pii_type, pattern, text):
             matches.append(PIIMatch(
                 pii_type=pii_type,
                 value=match.group(),
@@ -99,8 +300,12 @@ class PIIDetector:
         Returns:
             True if PII detected
         """
-        for pattern in self.patterns.values():
-            if re.search(pattern, text):
+        for pii_type in self._candidate_types(text):
+            pattern = self.patterns[pii_type]
+            if pii_type in MATCH_FILTERS:
+                if next(self._finditer(pii_type, pattern, text), None) is not None:
+                    return True
+            elif re.search(pattern, text):
                 return True
         
         return False
@@ -163,32 +368,7 @@ class PIIRedactor:
         
         # Mask from end to start to preserve positions
         for match in reversed(matches):
-            value = match.value
-            
-            if match.pii_type == "email":
-                # email@example.com -> e***@example.com
-                parts = value.split('@')
-                if len(parts) == 2:
-                    masked = parts[0][0] + '***@' + parts[1]
-                else:
-                    masked = '***'
-            
-            elif match.pii_type in ["phone", "ssn", "credit_card"]:
-                # Show last 4 digits
-                masked = '***-***-' + value[-4:]
-            
-            elif match.pii_type == "ip_address":
-                # Show first octet
-                parts = value.split('.')
-                masked = parts[0] + '.***.***.***'
-            
-            else:
-                # Default: show last 4 characters
-                if len(value) > 4:
-                    masked = '***' + value[-4:]
-                else:
-                    masked = '***'
-            
+            masked = MASKERS.get(match.pii_type, _mask_default)(match.value)
             text = text[:match.start] + masked + text[match.end:]
         
         return text
@@ -200,6 +380,10 @@ class PIIRedactor:
     ) -> Dict[str, Any]:
         """Redact PII from dictionary recursively.
         
+        Nested dicts and lists are walked iteratively. All string leaves are
+        joined with a NUL separator and scanned in a single pass; if a match
+        would span two leaves, each leaf is redacted on its own instead.
+        
         Args:
             data: Dictionary to redact
             replacement: Replacement string
@@ -207,36 +391,127 @@ class PIIRedactor:
         Returns:
             Redacted dictionary
         """
-        result = {}
-        
-        for key, value in data.items():
-            if isinstance(value, str):
-                result[key] = self.redact(value, replacement)
-            elif isinstance(value, dict):
-                result[key] = self.redact_dict(value, replacement)
-            elif isinstance(value, list):
-                result[key] = [
-                    self.redact(item, replacement) if isinstance(item, str)
-                    else self.redact_dict(item, replacement) if isinstance(item, dict)
-                    else item
-                    for item in value
-                ]
-            else:
-                result[key] = value
+        result: Dict[str, Any] = {}
+        leaves: List[tuple] = []
+        values: List[str] = []
+        stack: List[tuple] = [(data.items(), result)]
+        
+        while stack:
+            items, target = stack.pop()
+            for key, value in items:
+                kind = type(value)
+                if kind not in _WALK_TYPES:
+                    kind = next((t for t in _WALK_TYPES if isinstance(value, t)), None)
+                
+                if kind is str:
+                    target[key] = value
+                    leaves.append((target, key))
+                    values.append(value)
+                elif kind is dict:
+                    target[key] = {}
+                    stack.append((value.items(), target[key]))
+                elif kind is list:
+                    target[key] = [None] * len(value)
+                    stack.append((enumerate(value), target[key]))
+                else:
+                    target[key] = value
+        
+        if not values:
+            return result
+        
+        joined = _LEAF_SEPARATOR.join(values)
+        redacted = None
+        if joined.count(_LEAF_SEPARATOR) == len(values) - 1:
+            redacted = self.redact(joined, replacement).split(_LEAF_SEPARATOR)
+        
+        if redacted is None or len(redacted) != len(values):
+            redacted = [self.redact(value, replacement) for value in values]
+        
+        for (target, key), value in zip(leaves, redacted):
+            target[key] = value
         
         return result
 
 
 class PIIAuditLogger:
-    """Log PII access for compliance."""
+    """Log PII access for compliance.
+    
+    Entries are partitioned into one file per UTC day next to ``log_file``
+    (``pii_audit.log`` -> ``pii_audit_2024-01-15.log``) so queries only read
+    the days they cover. Writes go through a long-lived buffered handle and
+    are flushed (with fsync) every ``flush_every`` entries, on
+    ``flush()``/``close()``, before reads, and at interpreter exit.
+    """
     
-    def __init__(self, log_file: str = "pii_audit.log"):
+    def __init__(self, log_file: str = "pii_audit.log", flush_every: int = 100):
         """Initialize PII audit logger.
         
         Args:
-            log_file: Path to audit log file
+            log_file: Base path of the audit log; daily files are derived from it
+            flush_every: Number of buffered entries before forcing a flush
         """
         self.log_file = log_file
+        self.flush_every = max(1, flush_every)
+        
+        log_dir, name = os.path.split(log_file)
+        stem, ext = os.path.splitext(name)
+        self.log_dir = log_dir or "."
+        self._prefix = f"{stem}_"
+        self._suffix = ext or ".log"
+        
+        self._fh: Optional[BinaryIO] = None
+        self._fh_day: Optional[date] = None
+        self._pending = 0
+        atexit.register(self.close)
+    
+    def _partition_path(self, day: date) -> str:
+        """Get the log file path for a UTC day."""
+        return os.path.join(self.log_dir, f"{self._prefix}{day:%Y-%m-%d}{self._suffix}")
+    
+    def _handle(self, day: date) -> BinaryIO:
+        """Get the append handle for a day, rotating files when the day changes."""
+        if self._fh is None or self._fh.closed or self._fh_day != day:
+            self.close()
+            self._fh = open(self._partition_path(day), "ab", buffering=1 << 16)
+            self._fh_day = day
+        return self._fh
+    
+    def _partition_files(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime]
+    ) -> List[str]:
+        """List daily log files overlapping a time range.
+        
+        Args:
+            start_time: Range start (default: unbounded)
+            end_time: Range end (default: unbounded)
+            
+        Returns:
+            Matching file paths in chronological order
+        """
+        pattern = os.path.join(
+            glob.escape(self.log_dir),
+            f"{glob.escape(self._prefix)}*{glob.escape(self._suffix)}"
+        )
+        paths = []
+        
+        for path in sorted(glob.glob(pattern)):
+            stamp = os.path.basename(path)[len(self._prefix):-len(self._suffix)]
+            try:
+                day = date.fromisoformat(stamp)
+            except ValueError:
+                continue
+            
+            if start_time and day < start_time.date():
+                continue
+            
+            if end_time and day > end_time.date():
+                continue
+            
+            paths.append(path)
+        
+        return paths
     
     def log_access(
         self,
@@ -253,17 +528,37 @@ class PIIAuditLogger:
             action: Action performed (read, write, delete)
             context: Additional context
         """
+        now = datetime.utcnow()
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "user_id": user_id,
             "pii_type": pii_type,
             "action": action,
             "context": context
         }
         
-        with open(self.log_file, 'a') as f:
-            import json
-            f.write(json.dumps(log_entry) + '\n')
+        self._handle(now.date()).write(_encode_entry(log_entry))
+        self._pending += 1
+        
+        if self._pending >= self.flush_every:
+            self.flush()
+    
+    def flush(self):
+        """Flush buffered entries to disk."""
+        if self._fh is None or self._fh.closed or not self._pending:
+            return
+        
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._pending = 0
+    
+    def close(self):
+        """Flush buffered entries and close the log file."""
+        if self._fh is None or self._fh.closed:
+            return
+        
+        self.flush()
+        self._fh.close()
     
     def get_logs(
         self,
@@ -283,37 +578,38 @@ class PIIAuditLogger:
         Returns:
             List of log entries
         """
-        import json
+        self.flush()
         logs = []
         
-        try:
-            with open(self.log_file, 'r') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        
-                        # Apply filters
-                        if user_id and entry.get("user_id") != user_id:
-                            continue
-                        
-                        if pii_type and entry.get("pii_type") != pii_type:
-                            continue
+        for path in self._partition_files(start_time, end_time):
+            try:
+                with open(path, 'rb') as f:
+                    for line in f:
+                        try:
+                            entry = _decode_entry(line)
+                            
+                            # Apply filters
+                            if user_id and entry.get("user_id") != user_id:
+                                continue
+                            
+                            if pii_type and entry.get("pii_type") != pii_type:
+                                continue
+                            
+                            timestamp = datetime.fromisoformat(entry["timestamp"])
+                            
+                            if start_time and timestamp < start_time:
+                                continue
+                            
+                            if end_time and timestamp > end_time:
+                                continue
+                            
+                            logs.append(entry)
                         
-                        timestamp = datetime.fromisoformat(entry["timestamp"])
-                        
-                        if start_time and timestamp < start_time:
-                            continue
-                        
-                        if end_time and timestamp > end_time:
+                        except ValueError:
                             continue
-                        
-                        logs.append(entry)
-                    
-                    except json.JSONDecodeError:
-                        continue
-        
-        except FileNotFoundError:
-            pass
+            
+            except FileNotFoundError:
+                continue
         
         return logs
 
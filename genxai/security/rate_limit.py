@@ -1,8 +1,7 @@
-"""Rate limiting for GenXAI using token bucket algorithm."""
+"""Rate limiting for GenXAI using token bucket and sliding window algorithms."""
 
 import time
-import asyncio
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from functools import wraps
 from dataclasses import dataclass
 import os
@@ -50,55 +49,179 @@ class TokenBucket:
         self.capacity = capacity
         self.tokens = capacity
         self.last_update = time.time()
-        self.lock = asyncio.Lock()
     
-    async def consume(self, tokens: int = 1) -> bool:
+    def consume(self, tokens: int = 1) -> bool:
         """Consume tokens from bucket.
         
+        The update contains no await points, so it is atomic with respect
+        to other coroutines on the event loop and needs no lock.
+        
         Args:
             tokens: Number of tokens to consume
             
         Returns:
             True if tokens consumed, False if rate limited
         """
-        async with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
-            
-            # Add tokens based on elapsed time
-            self.tokens = min(
-                self.capacity,
-                self.tokens + elapsed * self.rate
-            )
-            self.last_update = now
-            
-            # Check if enough tokens
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            
-            return False
+        now = time.time()
+        elapsed = now - self.last_update
+        
+        # Add tokens based on elapsed time
+        self.tokens = min(
+            self.capacity,
+            self.tokens + elapsed * self.rate
+        )
+        self.last_update = now
+        
+        # Check if enough tokens
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        
+        return False
     
-    async def get_remaining(self) -> int:
+    def get_remaining(self) -> int:
         """Get remaining tokens.
         
         Returns:
             Number of remaining tokens
         """
-        async with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
+        now = time.time()
+        elapsed = now - self.last_update
+        
+        tokens = min(
+            self.capacity,
+            self.tokens + elapsed * self.rate
+        )
+        
+        return int(tokens)
+
+
+# Atomic sliding-window check for Redis. Usage is kept as one hash per key
+# with a field per minute slot; a single EVAL sums the minute/hour/day
+# windows, prunes expired slots and records the request.
+_REDIS_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local limit_minute = tonumber(ARGV[1])
+local limit_hour = tonumber(ARGV[2])
+local limit_day = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local slot = math.floor(tonumber(redis.call('TIME')[1]) / 60)
+local fields = redis.call('HGETALL', key)
+local minute, hour, day = 0, 0, 0
+for i = 1, #fields, 2 do
+    local s = tonumber(fields[i])
+    local c = tonumber(fields[i + 1])
+    if s <= slot - 1440 then
+        redis.call('HDEL', key, fields[i])
+    else
+        day = day + c
+        if s > slot - 60 then hour = hour + c end
+        if s == slot then minute = minute + c end
+    end
+end
+if cost == 0 then
+    return {1, minute, hour, day}
+end
+if minute + cost > limit_minute or hour + cost > limit_hour or day + cost > limit_day then
+    return {0, minute, hour, day}
+end
+redis.call('HINCRBY', key, slot, cost)
+redis.call('EXPIRE', key, 86400)
+return {1, minute + cost, hour + cost, day + cost}
+"""
+
+
+class SlidingWindowCounter:
+    """Per-key usage counter covering minute, hour and day windows.
+    
+    Usage is recorded in a ring of one-minute slots spanning a day, with
+    running totals for the hour and day windows, so a single counter
+    answers all three limits in O(1) amortized time.
+    """
+    
+    SLOT_SECONDS = 60
+    HOUR_SLOTS = 60
+    DAY_SLOTS = 1440
+    
+    def __init__(self):
+        """Initialize sliding window counter."""
+        self.counts = [0] * self.DAY_SLOTS
+        self.slot: Optional[int] = None
+        self.hour_total = 0
+        self.day_total = 0
+    
+    def _advance(self, slot: int) -> None:
+        """Move the window forward, expiring slots that fell out of range.
+        
+        Args:
+            slot: Current minute slot
+        """
+        if self.slot is None:
+            self.slot = slot
+            return
+        
+        steps = slot - self.slot
+        if steps <= 0:
+            return
+        
+        if steps >= self.DAY_SLOTS:
+            self.counts = [0] * self.DAY_SLOTS
+            self.hour_total = 0
+            self.day_total = 0
+        else:
+            for s in range(self.slot + 1, slot + 1):
+                self.hour_total -= self.counts[(s - self.HOUR_SLOTS) % self.DAY_SLOTS]
+                index = s % self.DAY_SLOTS
+                self.day_total -= self.counts[index]
+                self.counts[index] = 0
+        
+        self.slot = slot
+    
+    def usage(self, now: Optional[float] = None) -> Tuple[int, int, int]:
+        """Get current usage.
+        
+        Args:
+            now: Current timestamp (defaults to time.time())
             
-            tokens = min(
-                self.capacity,
-                self.tokens + elapsed * self.rate
-            )
+        Returns:
+            Tuple of (minute, hour, day) usage
+        """
+        slot = int((time.time() if now is None else now) // self.SLOT_SECONDS)
+        self._advance(slot)
+        return self.counts[slot % self.DAY_SLOTS], self.hour_total, self.day_total
+    
+    def consume(
+        self,
+        config: RateLimitConfig,
+        cost: int = 1,
+        now: Optional[float] = None
+    ) -> bool:
+        """Record usage if all windows have capacity left.
+        
+        Args:
+            config: Limits to enforce
+            cost: Cost in tokens
+            now: Current timestamp (defaults to time.time())
             
-            return int(tokens)
+        Returns:
+            True if usage recorded, False if rate limited
+        """
+        minute, hour, day = self.usage(now)
+        if (
+            minute + cost > config.requests_per_minute
+            or hour + cost > config.requests_per_hour
+            or day + cost > config.requests_per_day
+        ):
+            return False
+        
+        self.counts[self.slot % self.DAY_SLOTS] += cost
+        self.hour_total += cost
+        self.day_total += cost
+        return True
 
 
 class RateLimiter:
-    """Rate limiter using token bucket algorithm."""
+    """Rate limiter using a sliding window counter per key."""
     
     def __init__(self, storage: str = "memory"):
         """Initialize rate limiter.
@@ -107,7 +230,7 @@ class RateLimiter:
             storage: Storage backend (memory or redis)
         """
         self.storage = storage
-        self.buckets: Dict[str, Dict[str, TokenBucket]] = {}
+        self.windows: Dict[str, SlidingWindowCounter] = {}
         
         # Try to import Redis if using redis storage
         if storage == "redis":
@@ -115,6 +238,7 @@ class RateLimiter:
                 import redis
                 redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
                 self.redis_client = redis.from_url(redis_url)
+                self._redis_script = self.redis_client.register_script(_REDIS_WINDOW_SCRIPT)
             except ImportError:
                 print("Redis not available, falling back to memory storage")
                 self.storage = "memory"
@@ -137,109 +261,47 @@ class RateLimiter:
         """
         config = RATE_LIMITS.get(tier, RATE_LIMITS["free"])
         
-        # Check minute limit
-        minute_key = f"{key}:minute"
-        if not await self._check_bucket(
-            minute_key,
-            rate=config.requests_per_minute / 60,
-            capacity=config.requests_per_minute,
-            cost=cost
-        ):
-            return False
-        
-        # Check hour limit
-        hour_key = f"{key}:hour"
-        if not await self._check_bucket(
-            hour_key,
-            rate=config.requests_per_hour / 3600,
-            capacity=config.requests_per_hour,
-            cost=cost
-        ):
-            return False
-        
-        # Check day limit
-        day_key = f"{key}:day"
-        if not await self._check_bucket(
-            day_key,
-            rate=config.requests_per_day / 86400,
-            capacity=config.requests_per_day,
-            cost=cost
-        ):
-            return False
-        
-        return True
-    
-    async def _check_bucket(
-        self,
-        key: str,
-        rate: float,
-        capacity: int,
-        cost: int
-    ) -> bool:
-        """Check token bucket.
-        
-        Args:
-            key: Bucket key
-            rate: Tokens per second
-            capacity: Bucket capacity
-            cost: Tokens to consume
-            
-        Returns:
-            True if tokens consumed, False if rate limited
-        """
         if self.storage == "memory":
-            # Get or create bucket
-            if key not in self.buckets:
-                self.buckets[key] = {}
-            
-            if "bucket" not in self.buckets[key]:
-                self.buckets[key]["bucket"] = TokenBucket(rate, capacity)
-            
-            bucket = self.buckets[key]["bucket"]
-            return await bucket.consume(cost)
+            window = self.windows.get(key)
+            if window is None:
+                window = self.windows[key] = SlidingWindowCounter()
+            return window.consume(config, cost)
         
         elif self.storage == "redis":
-            # Redis-based rate limiting using Lua script
-            # This is a simplified version
-            return await self._check_redis_bucket(key, rate, capacity, cost)
+            try:
+                allowed, _, _, _ = self._run_redis_script(key, config, cost)
+                return bool(allowed)
+            except Exception:
+                # Fallback to allowing request if Redis fails
+                return True
         
         return True
     
-    async def _check_redis_bucket(
+    def _run_redis_script(
         self,
         key: str,
-        rate: float,
-        capacity: int,
+        config: RateLimitConfig,
         cost: int
-    ) -> bool:
-        """Check rate limit using Redis.
+    ) -> List[int]:
+        """Run the sliding window script in a single Redis round-trip.
         
         Args:
-            key: Bucket key
-            rate: Tokens per second
-            capacity: Bucket capacity
-            cost: Tokens to consume
+            key: User ID or API key
+            config: Limits to enforce
+            cost: Tokens to consume (0 only reads usage)
             
         Returns:
-            True if within limit, False if rate limited
+            List of [allowed, minute, hour, day] usage
         """
-        # Simplified Redis implementation
-        # In production, use a Lua script for atomicity
-        try:
-            current = self.redis_client.get(key)
-            if current is None:
-                self.redis_client.setex(key, 60, capacity - cost)
-                return True
-            
-            current = int(current)
-            if current >= cost:
-                self.redis_client.decrby(key, cost)
-                return True
-            
-            return False
-        except Exception:
-            # Fallback to allowing request if Redis fails
-            return True
+        return self._redis_script(
+            keys=[f"ratelimit:{key}"],
+            args=[
+                config.requests_per_minute,
+                config.requests_per_hour,
+                config.requests_per_day,
+                cost,
+            ],
+        )
     
     async def get_remaining(self, key: str, tier: str = "free") -> Dict[str, int]:
         """Get remaining requests.
@@ -252,39 +314,24 @@ class RateLimiter:
             Dictionary with remaining requests per period
         """
         config = RATE_LIMITS.get(tier, RATE_LIMITS["free"])
+        minute = hour = day = 0
         
-        minute_key = f"{key}:minute"
-        hour_key = f"{key}:hour"
-        day_key = f"{key}:day"
-        
-        return {
-            "minute": await self._get_bucket_remaining(minute_key),
-            "hour": await self._get_bucket_remaining(hour_key),
-            "day": await self._get_bucket_remaining(day_key),
-        }
-    
-    async def _get_bucket_remaining(self, key: str) -> int:
-        """Get remaining tokens in bucket.
-        
-        Args:
-            key: Bucket key
-            
-        Returns:
-            Remaining tokens
-        """
         if self.storage == "memory":
-            if key in self.buckets and "bucket" in self.buckets[key]:
-                return await self.buckets[key]["bucket"].get_remaining()
-            return 0
+            window = self.windows.get(key)
+            if window is not None:
+                minute, hour, day = window.usage()
         
         elif self.storage == "redis":
             try:
-                current = self.redis_client.get(key)
-                return int(current) if current else 0
+                _, minute, hour, day = self._run_redis_script(key, config, 0)
             except Exception:
-                return 0
+                return {"minute": 0, "hour": 0, "day": 0}
         
-        return 0
+        return {
+            "minute": max(0, config.requests_per_minute - minute),
+            "hour": max(0, config.requests_per_hour - hour),
+            "day": max(0, config.requests_per_day - day),
+        }
 
 
 class RateLimitExceeded(Exception):
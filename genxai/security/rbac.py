@@ -1,8 +1,11 @@
 """Role-Based Access Control (RBAC) for GenXAI."""
 
+import asyncio
+from contextvars import ContextVar
 from enum import Enum
-from typing import List, Set, Optional
-from functools import wraps
+from typing import FrozenSet, Iterable, List, Optional
+from functools import reduce, wraps
+import operator
 from dataclasses import dataclass
 
 
@@ -44,10 +47,10 @@ class Permission(Enum):
 
 
 # Role-Permission mapping
-ROLE_PERMISSIONS: dict[Role, Set[Permission]] = {
-    Role.ADMIN: set(Permission),  # All permissions
+ROLE_PERMISSIONS: dict[Role, FrozenSet[Permission]] = {
+    Role.ADMIN: frozenset(Permission),  # All permissions
     
-    Role.DEVELOPER: {
+    Role.DEVELOPER: frozenset({
         Permission.AGENT_CREATE,
         Permission.AGENT_READ,
         Permission.AGENT_UPDATE,
@@ -60,9 +63,9 @@ ROLE_PERMISSIONS: dict[Role, Set[Permission]] = {
         Permission.TOOL_EXECUTE,
         Permission.MEMORY_READ,
         Permission.MEMORY_WRITE,
-    },
+    }),
     
-    Role.OPERATOR: {
+    Role.OPERATOR: frozenset({
         Permission.AGENT_READ,
         Permission.AGENT_EXECUTE,
         Permission.WORKFLOW_READ,
@@ -70,14 +73,32 @@ ROLE_PERMISSIONS: dict[Role, Set[Permission]] = {
         Permission.TOOL_READ,
         Permission.TOOL_EXECUTE,
         Permission.MEMORY_READ,
-    },
+    }),
     
-    Role.VIEWER: {
+    Role.VIEWER: frozenset({
         Permission.AGENT_READ,
         Permission.WORKFLOW_READ,
         Permission.TOOL_READ,
         Permission.MEMORY_READ,
-    },
+    }),
+}
+
+# Bitmask form of ROLE_PERMISSIONS: each permission owns one bit, so
+# permission checks reduce to integer AND operations.
+PERM_BIT: dict[Permission, int] = {p: 1 << i for i, p in enumerate(Permission)}
+
+
+def _permissions_mask(permissions: Iterable[Permission]) -> int:
+    """Combine permissions into a single bitmask.
+    
+    Args:
+x with one bit set per permission
+    """
+    return reduce(operator.or_, (PERM_BIT[p] for p in permissions), 0)
+
+
+ROLE_MASK: dict[Role, int] = {
+    role: _permissions_mask(perms) for role, perms in ROLE_PERMISSIONS.items()
 }
 
 
@@ -96,7 +117,7 @@ class User:
         Returns:
             True if user has permission
         """
-        return permission in ROLE_PERMISSIONS[self.role]
+        return bool(ROLE_MASK[self.role] & PERM_BIT[permission])
     
     def has_any_permission(self, permissions: List[Permission]) -> bool:
         """Check if user has any of the permissions.
@@ -107,8 +128,7 @@ class User:
         Returns:
             True if user has any permission
         """
-        user_permissions = ROLE_PERMISSIONS[self.role]
-        return any(p in user_permissions for p in permissions)
+        return bool(ROLE_MASK[self.role] & _permissions_mask(permissions))
     
     def has_all_permissions(self, permissions: List[Permission]) -> bool:
         """Check if user has all permissions.
@@ -119,8 +139,8 @@ class User:
         Returns:
             True if user has all permissions
         """
-        user_permissions = ROLE_PERMISSIONS[self.role]
-        return all(p in user_permissions for p in permissions)
+        needed = _permissions_mask(permissions)
+        return (ROLE_MASK[self.role] & needed) == needed
 
 
 class PermissionDenied(Exception):
@@ -128,8 +148,8 @@ class PermissionDenied(Exception):
     pass
 
 
-# Current user context (thread-local in production)
-_current_user: Optional[User] = None
+# Current user context, isolated per thread and per asyncio task
+_current_user: ContextVar[Optional[User]] = ContextVar("current_user", default=None)
 
 
 def set_current_user(user: User):
@@ -138,8 +158,7 @@ def set_current_user(user: User):
     Args:
         user: User object
     """
-    global _current_user
-    _current_user = user
+    _current_user.set(user)
 
 
 def get_current_user() -> Optional[User]:
@@ -148,7 +167,45 @@ def get_current_user() -> Optional[User]:
     Returns:
         Current user or None
     """
-    return _current_user
+    return _current_user.get()
+
+
+def _check_permission(permission: Permission) -> None:
+    """Ensure the current user has a permission.
+    
+    Args:
+        permission: Required permission
+        
+    Raises:
+        PermissionDenied: If there is no user or the permission is missing
+    """
+    user = get_current_user()
+    if not user:
+        raise PermissionDenied("No user context")
+    
+    if not user.has_permission(permission):
+        raise PermissionDenied(
+            f"User {user.user_id} missing permission: {permission.value}"
+        )
+
+
+def _check_role(role: Role) -> None:
+    """Ensure the current user has a role.
+    
+    Args:
+        role: Required role
+        
+    Raises:
+        PermissionDenied: If there is no user or the role does not match
+    """
+    user = get_current_user()
+    if not user:
+        raise PermissionDenied("No user context")
+    
+    if user.role != role:
+        raise PermissionDenied(
+            f"User {user.user_id} requires role: {role.value}"
+        )
 
 
 def require_permission(permission: Permission):
@@ -163,38 +220,20 @@ def require_permission(permission: Permission):
             pass
     """
     def decorator(func):
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            user = get_current_user()
-            if not user:
-                raise PermissionDenied("No user context")
-            
-            if not user.has_permission(permission):
-                raise PermissionDenied(
-                    f"User {user.user_id} missing permission: {permission.value}"
-                )
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                _check_permission(permission)
+                return await func(*args, **kwargs)
             
-            return await func(*args, **kwargs)
+            return async_wrapper
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            user = get_current_user()
-            if not user:
-                raise PermissionDenied("No user context")
-            
-            if not user.has_permission(permission):
-                raise PermissionDenied(
-                    f"User {user.user_id} missing permission: {permission.value}"
-                )
-            
+            _check_permission(permission)
             return func(*args, **kwargs)
         
-        # Return appropriate wrapper
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
 
@@ -211,37 +250,19 @@ def require_role(role: Role):
             pass
     """
     def decorator(func):
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            user = get_current_user()
-            if not user:
-                raise PermissionDenied("No user context")
-            
-            if user.role != role:
-                raise PermissionDenied(
-                    f"User {user.user_id} requires role: {role.value}"
-                )
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                _check_role(role)
+                return await func(*args, **kwargs)
             
-            return await func(*args, **kwargs)
+            return async_wrapper
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            user = get_current_user()
-            if not user:
-                raise PermissionDenied("No user context")
-            
-            if user.role != role:
-                raise PermissionDenied(
-                    f"User {user.user_id} requires role: {role.value}"
-                )
-            
+            _check_role(role)
             return func(*args, **kwargs)
         
-        # Return appropriate wrapper
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
     
     return decorator
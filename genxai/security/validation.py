@@ -1,11 +1,62 @@
 """Input validation and sanitization for GenXAI."""
 
 import re
+import ipaddress
 from typing import Any, Dict
+from urllib.parse import urlparse
 from pydantic import BaseModel, Field, validator
 import html
 
 
+# Precompiled patterns used by the validators and sanitizers below.
+# Related patterns are fused into one alternation so each check is a
+# single regex pass.
+_ALL_SQL_INJECTION = re.compile(
+    '|'.join(
+        f'(?:{p})'
+        for p in (
+            r'(?:DROP|DELETE|INSERT|UPDATE|ALTER|CREATE)\s+(?:TABLE|DATABASE|INDEX)',
+            r';\s*(?:DROP|DELETE|INSERT|UPDATE)',
+            r'--\s*$',
+            r'/\*.*\*/',
+        )
+    ),
+    re.IGNORECASE,
+)
+
+_SQL_COMMENT_LINE_RE = re.compile(r'--.*$', re.MULTILINE)
+_SQL_COMMENT_BLOCK_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_SQL_KEYWORDS_RE = re.compile(
+    r'\b(?:DROP|DELETE|INSERT|UPDATE|ALTER|CREATE|EXEC|EXECUTE)\b', re.IGNORECASE
+)
+
+# Script and event-handler patterns use unrolled loops / explicit alternatives
+# instead of lazy or optional quantifiers so they cannot backtrack heavily
+_HTML_SCRIPT_RE = re.compile(
+    r'<script\b[^<>]*>[^<]*(?:<(?!/script>)[^<]*)*</script>', re.IGNORECASE
+)
+_HTML_SCRIPT_CLOSE_RE = re.compile(r'</script>', re.IGNORECASE)
+_HTML_EVENT_HANDLER_RE = re.compile(
+    r'\s*on\w+\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+)', re.IGNORECASE
+)
+_HTML_JS_PROTOCOL_RE = re.compile(r'javascript:', re.IGNORECASE)
+
+# Shell metacharacters for chaining, substitution and redirection
+_CMD_FORBIDDEN_CHARS = str.maketrans('', '', ';&|`$<>')
+_CMD_DANGEROUS_LITERALS = (
+    '/etc/passwd',  # Sensitive files
+    '/etc/shadow',
+    'rm -rf',  # Dangerous commands
+    'dd if=',
+)
+_ALLOWED_COMMANDS = ['ls', 'cat', 'echo', 'pwd', 'date', 'whoami']
+
+_PATH_SEPARATORS_RE = re.compile(r'/+')
+
+# Internal hosts rejected by validate_url; numeric hosts are checked with ipaddress
+_INTERNAL_LITERALS = ('localhost', '127.0.0.1', '0.0.0.0')
+
+
 class AgentExecutionRequest(BaseModel):
     """Validate agent execution request."""
     task: str = Field(..., min_length=1, max_length=10000)
@@ -16,16 +67,8 @@ class AgentExecutionRequest(BaseModel):
     @validator('task')
     def validate_task(cls, v):
         """Validate task for SQL injection patterns."""
-        dangerous_patterns = [
-            r'(DROP|DELETE|INSERT|UPDATE|ALTER|CREATE)\s+(TABLE|DATABASE|INDEX)',
-            r';\s*(DROP|DELETE|INSERT|UPDATE)',
-            r'--\s*$',
-            r'/\*.*\*/',
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, v, re.IGNORECASE):
-                raise ValueError("Potential SQL injection detected")
+        if _ALL_SQL_INJECTION.search(v):
+            raise ValueError("Potential SQL injection detected")
         
         return v
 
@@ -57,13 +100,11 @@ def sanitize_sql(query: str) -> str:
         This is a basic sanitizer. Always use parameterized queries in production.
     """
     # Remove comments
-    query = re.sub(r'--.*$', '', query, flags=re.MULTILINE)
-    query = re.sub(r'/\*.*?\*/', '', query, flags=re.DOTALL)
+    query = _SQL_COMMENT_LINE_RE.sub('', query)
+    query = _SQL_COMMENT_BLOCK_RE.sub('', query)
     
     # Remove dangerous keywords
-    dangerous_keywords = ['DROP', 'DELETE', 'INSERT', 'UPDATE', 'ALTER', 'CREATE', 'EXEC', 'EXECUTE']
-    for keyword in dangerous_keywords:
-        query = re.sub(rf'\b{keyword}\b', '', query, flags=re.IGNORECASE)
+    query = _SQL_KEYWORDS_RE.sub('', query)
     
     # Escape single quotes
     query = query.replace("'", "''")
@@ -71,6 +112,24 @@ def sanitize_sql(query: str) -> str:
     return query.strip()
 
 
+def _strip_script_tags(text: str) -> str:
+    """Remove <script> elements.
+    
+    Only the text up to the last closing tag is scanned: an opening tag
+    after it can never match, and scanning it would make unterminated
+    input quadratic.
+    """
+    last = None
+    for last in _HTML_SCRIPT_CLOSE_RE.finditer(text):
+        pass
+    
+    if last is None:
+        return text
+    
+    end = last.end()
+    return _HTML_SCRIPT_RE.sub('', text[:end]) + text[end:]
+
+
 def sanitize_html(text: str) -> str:
     """Sanitize HTML to prevent XSS.
     
@@ -84,13 +143,13 @@ def sanitize_html(text: str) -> str:
     text = html.escape(text)
     
     # Remove script tags
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _strip_script_tags(text)
     
     # Remove event handlers
-    text = re.sub(r'\s*on\w+\s*=\s*["\']?[^"\']*["\']?', '', text, flags=re.IGNORECASE)
+    text = _HTML_EVENT_HANDLER_RE.sub('', text)
     
     # Remove javascript: protocol
-    text = re.sub(r'javascript:', '', text, flags=re.IGNORECASE)
+    text = _HTML_JS_PROTOCOL_RE.sub('', text)
     
     return text
 
@@ -107,29 +166,23 @@ def sanitize_command(cmd: str) -> str:
     Raises:
         ValueError: If command contains dangerous patterns
     """
-    # Check for dangerous patterns
-    dangerous_patterns = [
-        r'[;&|`$]',  # Command chaining
-        r'\$\(',  # Command substitution
-        r'>\s*/dev/',  # Device access
-        r'<\s*/dev/',
-        r'/etc/passwd',  # Sensitive files
-        r'/etc/shadow',
-        r'rm\s+-rf',  # Dangerous commands
-        r'dd\s+if=',
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, cmd):
-            raise ValueError(f"Dangerous command pattern detected: {pattern}")
-    
     # Whitelist allowed commands
-    allowed_commands = ['ls', 'cat', 'echo', 'pwd', 'date', 'whoami']
-    cmd_name = cmd.split()[0] if cmd.split() else ''
+    words = cmd.split()
+    cmd_name = words[0] if words else ''
     
-    if cmd_name not in allowed_commands:
+    if cmd_name not in _ALLOWED_COMMANDS:
         raise ValueError(f"Command not in whitelist: {cmd_name}")
     
+    # Check for shell metacharacters
+    if len(cmd.translate(_CMD_FORBIDDEN_CHARS)) != len(cmd):
+        raise ValueError("Dangerous command pattern detected: shell metacharacter")
+    
+    # Check for dangerous patterns (whitespace collapsed once)
+    normalized = ' '.join(words)
+    for literal in _CMD_DANGEROUS_LITERALS:
+        if literal in normalized:
+            raise ValueError(f"Dangerous command pattern detected: {literal}")
+    
     return cmd
 
 
@@ -159,7 +212,7 @@ def validate_file_path(path: str) -> str:
     
     # Normalize path
     path = path.replace('\\', '/')
-    path = re.sub(r'/+', '/', path)
+    path = _PATH_SEPARATORS_RE.sub('/', path)
     
     return path
 
@@ -183,18 +236,20 @@ def validate_url(url: str) -> str:
             raise ValueError(f"Dangerous protocol: {protocol}")
     
     # Check for localhost/internal IPs
-    internal_patterns = [
-        r'localhost',
-        r'127\.0\.0\.1',
-        r'0\.0\.0\.0',
-        r'10\.\d+\.\d+\.\d+',
-        r'172\.(1[6-9]|2[0-9]|3[0-1])\.\d+\.\d+',
-        r'192\.168\.\d+\.\d+',
-    ]
-    
-    for pattern in internal_patterns:
-        if re.search(pattern, url, re.IGNORECASE):
-            raise ValueError("Internal/localhost URLs not allowed")
+    url_lower = url.lower()
+    if any(literal in url_lower for literal in _INTERNAL_LITERALS):
+        raise ValueError("Internal/localhost URLs not allowed")
+    
+    host = urlparse(url if '://' in url else f'//{url}').hostname or ''
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        ip = None
+    
+    if ip is not None and (
+        ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_unspecified
+    ):
+        raise ValueError("Internal/localhost URLs not allowed")
     
     return url
 
@@ -1,6 +1,7 @@
 """Dynamic tool creation from Python code."""
 
 from typing import Any, Dict
+import asyncio
 import logging
 from genxai.tools.base import Tool, ToolMetadata, ToolParameter
 from genxai.tools.security import SafeExecutor, ExecutionTimeout
@@ -46,9 +47,30 @@ class DynamicTool(Tool):
             logger.error(f"Failed to compile code for {self.metadata.name}: {e}")
             raise ValueError(f"Invalid Python code: {e}")
 
+    def _run_sync(self, kwargs: Dict[str, Any]) -> Any:
+        """Run the compiled code synchronously in the sandbox.
+
+        The SIGALRM-based sandbox timeout only works on the main thread, so
+        the timeout is enforced by ``_execute`` instead.
+
+        Args:
+            kwargs: Tool parameters
+
+        Returns:
+            Tool execution result
+        """
+        return self._safe_executor.execute(
+            self._compiled_code,
+            kwargs,
+            enable_timeout=False
+        )
+
     async def _execute(self, **kwargs: Any) -> Any:
         """Execute the dynamic tool code in a sandboxed environment.
 
+        The code runs in the default thread pool so CPU-bound tools do not
+        block the event loop.
+
         Args:
             **kwargs: Tool parameters
 
@@ -56,17 +78,16 @@ class DynamicTool(Tool):
             Tool execution result
         """
         try:
-            # Execute with SafeExecutor (includes timeout and sandboxing)
-            result = self._safe_executor.execute(
-                self._compiled_code,
-                kwargs,
-                enable_timeout=True
+            loop = asyncio.get_running_loop()
+            result = await asyncio.wait_for(
+                loop.run_in_executor(None, self._run_sync, kwargs),
+                timeout=self.timeout
             )
             
             logger.info(f"Dynamic tool {self.metadata.name} executed successfully")
             return result
 
-        except ExecutionTimeout as e:
+        except (asyncio.TimeoutError, ExecutionTimeout) as e:
             logger.error(f"Dynamic tool {self.metadata.name} timed out: {e}")
             raise RuntimeError(f"Tool execution timed out after {self.timeout} seconds")
         except ValueError as e:
@@ -2,7 +2,8 @@
 
 import signal
 import logging
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from contextlib import contextmanager
 
 try:
@@ -18,6 +19,78 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _create_safe_builtins() -> Dict[str, Any]:
+    """Create a safe set of built-in functions.
+
+    Returns:
+        Dictionary of safe built-in functions
+    """
+    if RESTRICTED_PYTHON_AVAILABLE:
+        # Use RestrictedPython's safe globals as base
+        safe_builtins = safe_globals.copy()
+        
+        # Add additional safe functions
+        safe_builtins.update({
+            '_iter_unpack_sequence_': guarded_iter_unpack_sequence,
+            '_getattr_': safer_getattr,
+            # Safe built-ins
+            'abs': abs,
+            'all': all,
+            'any': any,
+            'bool': bool,
+            'dict': dict,
+            'enumerate': enumerate,
+            'float': float,
+            'int': int,
+            'len': len,
+            'list': list,
+            'max': max,
+            'min': min,
+            'range': range,
+            'round': round,
+            'sorted': sorted,
+            'str': str,
+            'sum': sum,
+            'tuple': tuple,
+            'zip': zip,
+            'isinstance': isinstance,
+            'type': type,
+            'hasattr': hasattr,
+            'getattr': safer_getattr,
+        })
+    else:
+        # Fallback to basic safe builtins
+        safe_builtins = {
+            'abs': abs,
+            'all': all,
+            'any': any,
+            'bool': bool,
+            'dict': dict,
+            'enumerate': enumerate,
+            'float': float,
+            'int': int,
+            'len': len,
+            'list': list,
+            'max': max,
+            'min': min,
+            'range': range,
+            'round': round,
+            'sorted': sorted,
+            'str': str,
+            'sum': sum,
+            'tuple': tuple,
+            'zip': zip,
+            'isinstance': isinstance,
+            'type': type,
+        }
+    
+    return safe_builtins
+
+
+# Shared read-only builtins for all sandboxed executions
+_SAFE_BUILTINS: Mapping[str, Any] = MappingProxyType(_create_safe_builtins())
+
+
 class ExecutionTimeout(Exception):
     """Raised when code execution exceeds timeout limit."""
     pass
@@ -39,74 +112,7 @@ class SafeExecutor:
             )
         
         self.timeout = timeout
-        self._safe_builtins = self._create_safe_builtins()
-
-    def _create_safe_builtins(self) -> Dict[str, Any]:
-        """Create a safe set of built-in functions.
-
-        Returns:
-            Dictionary of safe built-in functions
-        """
-        if RESTRICTED_PYTHON_AVAILABLE:
-            # Use RestrictedPython's safe globals as base
-            safe_builtins = safe_globals.copy()
-            
-            # Add additional safe functions
-            safe_builtins.update({
-                '_iter_unpack_sequence_': guarded_iter_unpack_sequence,
-                '_getattr_': safer_getattr,
-                # Safe built-ins
-                'abs': abs,
-                'all': all,
-                'any': any,
-                'bool': bool,
-                'dict': dict,
-                'enumerate': enumerate,
-                'float': float,
-                'int': int,
-                'len': len,
-                'list': list,
-                'max': max,
-                'min': min,
-                'range': range,
-                'round': round,
-                'sorted': sorted,
-                'str': str,
-                'sum': sum,
-                'tuple': tuple,
-                'zip': zip,
-                'isinstance': isinstance,
-                'type': type,
-                'hasattr': hasattr,
-                'getattr': safer_getattr,
-            })
-        else:
-            # Fallback to basic safe builtins
-            safe_builtins = {
-                'abs': abs,
-                'all': all,
-                'any': any,
-                'bool': bool,
-                'dict': dict,
-                'enumerate': enumerate,
-                'float': float,
-                'int': int,
-                'len': len,
-                'list': list,
-                'max': max,
-                'min': min,
-                'range': range,
-                'round': round,
-                'sorted': sorted,
-                'str': str,
-                'sum': sum,
-                'tuple': tuple,
-                'zip': zip,
-                'isinstance': isinstance,
-                'type': type,
-            }
-        
-        return safe_builtins
+        self._safe_builtins = _SAFE_BUILTINS
 
     @contextmanager
     def _timeout_context(self):
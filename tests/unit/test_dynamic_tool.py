@@ -0,0 +1,67 @@
+"""Unit tests for dynamic tools and the sandboxed executor."""
+
+import pytest
+
+from genxai.tools.base import ToolCategory, ToolMetadata, ToolParameter
+from genxai.tools.dynamic import DynamicTool
+from genxai.tools.security import SafeExecutor
+
+
+def _make_tool(code: str) -> DynamicTool:
+    metadata = ToolMetadata(
+        name="dynamic_test",
+        description="Dynamic test tool",
+        category=ToolCategory.CUSTOM,
+    )
+    parameters = [ToolParameter(name="x", type="number", description="Input value")]
+    return DynamicTool(metadata, parameters, code)
+
+
+def test_safe_executor_shares_read_only_builtins():
+    """Test executors share one immutable builtins mapping."""
+    first = SafeExecutor()
+    second = SafeExecutor(timeout=5)
+
+    assert first._safe_builtins is second._safe_builtins
+    with pytest.raises(TypeError):
+        first._safe_builtins["open"] = open
+
+
+def test_safe_executor_execute():
+    """Test executing code that sets result."""
+    executor = SafeExecutor()
+    assert executor.execute_code("result = sum(params['values'])", {"values": [1, 2, 3]}) == 6
+
+    with pytest.raises(RuntimeError):
+        executor.execute_code("value = 1", {})
+
+
+@pytest.mark.asyncio
+async def test_dynamic_tool_execute():
+    """Test executing a dynamic tool."""
+    tool = _make_tool("result = params['x'] * 2")
+
+    result = await tool.execute(x=21)
+    assert result.success
+    assert result.data == 42
+
+
+@pytest.mark.asyncio
+async def test_dynamic_tool_update_code():
+    """Test updating dynamic tool code."""
+    tool = _make_tool("result = params['x']")
+    tool.update_code("result = params['x'] + 1")
+
+    result = await tool.execute(x=1)
+    assert result.data == 2
+
+
+@pytest.mark.asyncio
+async def test_dynamic_tool_timeout_does_not_block_loop():
+    """Test slow tool code runs off the event loop and times out."""
+    tool = _make_tool("while True:\n    pass")
+    tool.timeout = 0.2
+
+    result = await tool.execute(x=1)
+    assert not result.success
+    assert "timed out" in result.error
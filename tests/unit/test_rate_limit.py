@@ -0,0 +1,67 @@
+"""Unit tests for rate limiting."""
+
+import pytest
+
+from genxai.security.rate_limit import (
+    RATE_LIMITS,
+    RateLimitConfig,
+    RateLimiter,
+    SlidingWindowCounter,
+    TokenBucket,
+)
+
+
+def test_token_bucket_consume():
+    """Test token bucket consumption is synchronous."""
+    bucket = TokenBucket(rate=0.0, capacity=2)
+    assert bucket.consume() is True
+    assert bucket.consume() is True
+    assert bucket.consume() is False
+    assert bucket.get_remaining() == 0
+
+
+def test_sliding_window_enforces_minute_limit():
+    """Test minute window resets on the next slot."""
+    config = RateLimitConfig(requests_per_minute=2, requests_per_hour=10, requests_per_day=100)
+    window = SlidingWindowCounter()
+
+    assert window.consume(config, now=0)
+    assert window.consume(config, now=30)
+    assert not window.consume(config, now=59)
+    assert window.consume(config, now=60)
+    assert window.usage(now=60) == (1, 3, 3)
+
+
+def test_sliding_window_expires_hour_and_day():
+    """Test hour and day totals drop as slots expire."""
+    config = RateLimitConfig(requests_per_minute=5, requests_per_hour=5, requests_per_day=6)
+    window = SlidingWindowCounter()
+
+    for _ in range(5):
+        assert window.consume(config, now=0)
+    assert not window.consume(config, now=120)
+
+    # Hour window has moved past the first slot, day window has not
+    assert window.consume(config, now=3600)
+    assert not window.consume(config, now=3660)
+    assert window.usage(now=3660) == (0, 1, 6)
+
+    # A full day later everything is free again
+    assert window.usage(now=86400 + 3600) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_memory():
+    """Test memory-backed rate limiter."""
+    limiter = RateLimiter()
+    limit = RATE_LIMITS["free"].requests_per_minute
+
+    results = [await limiter.check_rate_limit("user") for _ in range(limit + 1)]
+    assert results == [True] * limit + [False]
+
+    remaining = await limiter.get_remaining("user")
+    assert remaining["minute"] == 0
+    assert remaining["hour"] == RATE_LIMITS["free"].requests_per_hour - limit
+
+    fresh = await limiter.get_remaining("other")
+    assert fresh["day"] == RATE_LIMITS["free"].requests_per_day
@@ -0,0 +1,101 @@
+"""Unit tests for input validation and sanitization."""
+
+import pytest
+from pydantic import ValidationError
+
+from genxai.security.validation import (
+    AgentExecutionRequest,
+    _HTML_EVENT_HANDLER_RE,
+    _strip_script_tags,
+    sanitize_command,
+    sanitize_html,
+    sanitize_json,
+    sanitize_sql,
+    validate_file_path,
+    validate_url,
+)
+
+
+def test_agent_execution_request_rejects_sql_injection():
+    """Test SQL injection patterns in tasks are rejected."""
+    AgentExecutionRequest(task="Summarize the quarterly report", agent_id="agent_1")
+
+    for task in [
+        "drop table users",
+        "ok; DELETE from users",
+        "select 1 --",
+        "select /* hidden */ 1",
+    ]:
+        with pytest.raises(ValidationError):
+            AgentExecutionRequest(task=task, agent_id="agent_1")
+
+
+def test_sanitize_sql():
+    """Test SQL sanitization removes comments and keywords."""
+    assert sanitize_sql("SELECT name FROM t -- comment") == "SELECT name FROM t"
+    assert sanitize_sql("SELECT /* x */ 1") == "SELECT  1"
+    assert "drop" not in sanitize_sql("drop TABLE users").lower()
+    assert sanitize_sql("name = 'bob'") == "name = ''bob''"
+
+
+def test_sanitize_html():
+    """Test HTML sanitization escapes markup."""
+    assert sanitize_html("<b>hi</b>") == "&lt;b&gt;hi&lt;/b&gt;"
+    assert "javascript:" not in sanitize_html("javascript:alert(1)")
+    assert sanitize_html("plain text") == "plain text"
+
+
+def test_sanitize_command():
+    """Test shell command sanitization."""
+    assert sanitize_command("ls -la") == "ls -la"
+
+    for cmd in ["ls; rm file", "echo $(whoami)", "cat /etc/passwd", "cat < /dev/zero", "rm -rf /"]:
+        with pytest.raises(ValueError):
+            sanitize_command(cmd)
+
+    with pytest.raises(ValueError, match="whitelist"):
+        sanitize_command("python script.py")
+
+    with pytest.raises(ValueError, match="whitelist"):
+        sanitize_command("")
+
+
+def test_validate_file_path():
+    """Test file path validation."""
+    assert validate_file_path("data//files\\report.txt") == "data/files/report.txt"
+
+    for path in ["../secret", "/etc/hosts", "file\x00.txt"]:
+        with pytest.raises(ValueError):
+            validate_file_path(path)
+
+
+def test_validate_url():
+    """Test URL validation blocks internal targets."""
+    assert validate_url("https://example.com/api") == "https://example.com/api"
+
+    for url in [
+        "file:///etc/passwd",
+        "FTP://example.com",
+        "http://localhost:8000",
+        "http://127.0.0.1/",
+        "http://10.1.2.3/",
+        "http://172.16.0.1/",
+        "http://192.168.1.1/",
+        "http://[::1]/",
+        "http://169.254.169.254/latest/meta-data",
+    ]:
+        with pytest.raises(ValueError):
+            validate_url(url)
+
+
+def test_sanitize_json():
+    """Test nested JSON sanitization."""
+    data = {"a": "<i>x</i>", "b": [1, {"c": "ok"}], "d": None}
+    assert sanitize_json(data) == {"a": "&lt;i&gt;x&lt;/i&gt;", "b": [1, {"c": "ok"}], "d": None}
+
+
+def test_script_and_event_handler_patterns():
+    """Test script/event-handler stripping on raw markup."""
+    assert _strip_script_tags("a<script type=x>1<2</script>b<SCRIPT>x</SCRIPT>c") == "abc"
+    assert _strip_script_tags("<script>" * 5000) == "<script>" * 5000
+    assert _HTML_EVENT_HANDLER_RE.sub("", "<a onclick=\"go()\" onload=x>") == "<a>"